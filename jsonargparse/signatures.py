@@ -1,8 +1,15 @@
 """Metods to add arguments based on class/method/function signatures."""
 
 import inspect
+import logging
+import sys
 from enum import Enum
-from typing import Optional, Container, Type, Callable
+from collections.abc import Iterable
+from functools import lru_cache
+from itertools import chain
+from types import FunctionType
+from weakref import WeakKeyDictionary
+from typing import Optional, Container, Type, Callable, Dict
 
 from .util import _issubclass
 from .actions import ActionEnum, _ActionConfigLoad, _ActionHelpClassPath
@@ -14,6 +21,207 @@ from .optionals import docstring_parser_support, import_docstring_parse, datacla
 __all__ = ['SignatureArguments']
 
 
+if docstring_parser_support:
+    docstring_parse = import_docstring_parse('signatures.py')
+
+_HAS_DEFAULT_FACTORY_CLASS = None
+if dataclasses_support:
+    dataclasses = import_dataclasses('signatures.py')
+    _HAS_DEFAULT_FACTORY_CLASS = dataclasses._HAS_DEFAULT_FACTORY_CLASS
+
+_VAR_POS = inspect._ParameterKind.VAR_POSITIONAL
+_VAR_KW = inspect._ParameterKind.VAR_KEYWORD
+_EMPTY = inspect._empty
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool))
+
+
+def _signature(function):
+    """Returns the signature of a callable, building it directly from the code object for plain functions."""
+    if type(function) is not FunctionType or hasattr(function, '__wrapped__'):
+        return inspect.signature(function)
+    signature = getattr(function, '__signature__', None)
+    if signature is not None:
+        if not isinstance(signature, inspect.Signature):
+            raise TypeError('unexpected object {!r} in __signature__ attribute'.format(signature))
+        return signature
+
+    code = function.__code__
+    names = code.co_varnames
+    num_pos = code.co_argcount
+    num_posonly = getattr(code, 'co_posonlyargcount', 0)
+    num_kwonly = code.co_kwonlyargcount
+    defaults = function.__defaults__ or ()
+    kwdefaults = function.__kwdefaults__ or {}
+    annotations = function.__annotations__
+    num_required = num_pos - len(defaults)
+
+    params = []
+    for num, name in enumerate(names[:num_pos]):
+        kind = inspect.Parameter.POSITIONAL_ONLY if num < num_posonly else inspect.Parameter.POSITIONAL_OR_KEYWORD
+        default = defaults[num-num_required] if num >= num_required else _EMPTY
+        params.append(inspect.Parameter(name, kind, default=default, annotation=annotations.get(name, _EMPTY)))
+    num_var = num_pos + num_kwonly
+    if code.co_flags & inspect.CO_VARARGS:
+        name = names[num_var]
+        params.append(inspect.Parameter(name, _VAR_POS, annotation=annotations.get(name, _EMPTY)))
+        num_var += 1
+    for name in names[num_pos:num_pos+num_kwonly]:
+        default = kwdefaults.get(name, _EMPTY)
+        params.append(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=annotations.get(name, _EMPTY)))
+    if code.co_flags & inspect.CO_VARKEYWORDS:
+        name = names[num_var]
+        params.append(inspect.Parameter(name, _VAR_KW, annotation=annotations.get(name, _EMPTY)))
+
+    return inspect.Signature(params, return_annotation=annotations.get('return', _EMPTY))
+
+
+_signatures_cache = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+def _signature_state(function):
+    """Returns copies of the attributes of a plain function from which its signature is derived."""
+    if type(function) is not FunctionType:
+        return ()
+    return (
+        (function.__code__, getattr(function, '__signature__', None)),
+        function.__defaults__ or (),
+        tuple(chain.from_iterable((function.__kwdefaults__ or {}).items())),
+        tuple(chain.from_iterable(function.__annotations__.items())),
+    )
+
+
+def _same_state(state1, state2):
+    """Checks whether two signature states hold the same objects."""
+    return len(state1) == len(state2) and \
+        all(len(a) == len(b) and all(x is y for x, y in zip(a, b)) for a, b in zip(state1, state2))
+
+
+def _cached_signature(function):
+    """Returns the signature of a callable, reusing it while the callable is alive and unchanged."""
+    state = _signature_state(function)
+    try:
+        cached = _signatures_cache.get(function)
+    except TypeError:  # unhashable or not weak referenceable callable
+        return _signature(function)
+    if cached is not None and _same_state(cached[0], state):
+        return cached[1]
+    signature = _signature(function)
+    _signatures_cache[function] = (state, signature)
+    return signature
+
+
+_primitive_cache = WeakKeyDictionary()  # type: WeakKeyDictionary
+_enum_cache = WeakKeyDictionary()  # type: WeakKeyDictionary
+
+
+def _weak_cached(cache, key, function):
+    """Returns function(key) reusing the results stored in a weak keyed cache."""
+    try:
+        return cache[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable or not weak referenceable key
+        return function(key)
+    value = cache[key] = function(key)
+    return value
+
+
+def _check_primitive(annotation):
+    """Uncached check of _is_primitive."""
+    return annotation in _PRIMITIVE_TYPES or _issubclass(annotation, (str, int, float))
+
+
+def _check_enum(annotation):
+    """Uncached check of _is_enum."""
+    return _issubclass(annotation, Enum)
+
+
+def _is_primitive(annotation):
+    """Checks whether an annotation is str, int, float, bool or a subclass of these."""
+    try:
+        return _weak_cached(_primitive_cache, annotation, _check_primitive)
+    except TypeError:  # unhashable annotation
+        return False
+
+
+def _is_enum(annotation):
+    """Checks whether an annotation is an Enum subclass."""
+    return _weak_cached(_enum_cache, annotation, _check_enum)
+
+
+@lru_cache(maxsize=2048)
+def _lru_jsonschema_action(annotation, annotation_repr):
+    """Cached creation of the ActionJsonSchema used by _jsonschema_action."""
+    return ActionJsonSchema(annotation=annotation, enable_path=False)
+
+
+def _is_module_level(annotation):
+    """Checks whether an annotation only refers to classes reachable by name from their module."""
+    if not inspect.isclass(annotation):
+        args = getattr(annotation, '__args__', None)
+        if isinstance(args, tuple):
+            return _is_module_level(getattr(annotation, '__origin__', None)) and \
+                all(_is_module_level(a) for a in args)
+        return _is_module_level(type(annotation))
+    if annotation.__module__ == 'builtins':
+        return True
+    obj = sys.modules.get(annotation.__module__)
+    for name in annotation.__qualname__.split('.'):
+        obj = getattr(obj, name, None)
+    return obj is annotation
+
+
+def _jsonschema_action(annotation):
+    """Returns an ActionJsonSchema for an annotation, reusing it for repeated annotations.
+
+    Only annotations that refer to module level classes are cached, since the
+    actions reference their annotation and would otherwise keep alive classes
+    created at runtime. The repr is part of the cache key since typing
+    considers equal some annotations that are not the same, e.g.
+    Union[int, str] and Union[str, int].
+    """
+    try:
+        hash(annotation)
+    except TypeError:  # unhashable annotation
+        return ActionJsonSchema(annotation=annotation, enable_path=False)
+    if not _is_module_level(annotation):
+        return ActionJsonSchema(annotation=annotation, enable_path=False)
+    return _lru_jsonschema_action(annotation, repr(annotation))
+
+
+def _skip_set(skip):
+    """Returns skip as a frozenset if it is None or a non-str iterable, otherwise the container as given."""
+    if skip is None:
+        return frozenset()
+    if isinstance(skip, Iterable) and not isinstance(skip, str):
+        return frozenset(skip)
+    return skip
+
+
+def _find_in_mro(cls, name):
+    """Returns the raw attribute of a class looking in the __dict__ of its MRO, or None if not found."""
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+    return None
+
+
+def _class_docs(base):
+    """Returns the docstrings of a class and of its __init__."""
+    return [base.__init__.__doc__, base.__doc__]
+
+
+def _object_docs(obj):
+    """Returns the docstring of an object."""
+    return [obj.__doc__]
+
+
+@lru_cache(maxsize=1024)
+def _parse_doc(doc):
+    """Parses a docstring, failures raise and thus are not cached."""
+    return docstring_parse(doc)
+
+
 class SignatureArguments:
     """Methods to add arguments based on signatures to an ArgumentParser instance."""
 
@@ -46,18 +254,25 @@ class SignatureArguments:
         if not inspect.isclass(theclass):
             raise ValueError('Expected "theclass" argument to be a class object.')
 
-        def docs_func(base):
-            return [base.__init__.__doc__, base.__doc__]
-
         def sign_func(base):
             return base.__init__
 
-        return self._add_signature_arguments(inspect.getmro(theclass),
+        params = _cached_signature(theclass.__init__).parameters.values()
+        if not any(p._kind is _VAR_POS or p._kind is _VAR_KW for p in params):
+            mro = [theclass]
+        else:
+            mro = [c for c in inspect.getmro(theclass) if c is not object and c.__init__ is not object.__init__]  # type: ignore
+            if not mro:
+                mro = [theclass]
+
+        skip = _skip_set(skip)
+
+        return self._add_signature_arguments(mro,
                                              nested_key,
                                              as_group,
                                              as_positional,
                                              skip,
-                                             docs_func,
+                                             _class_docs,
                                              sign_func,
                                              skip_first=True)
 
@@ -95,9 +310,11 @@ class SignatureArguments:
         if not hasattr(theclass, themethod) or not callable(getattr(theclass, themethod)):
             raise ValueError('Expected "themethod" argument to be a callable member of the class.')
 
-        skip_first = not isinstance(inspect.getattr_static(theclass, themethod), staticmethod)
+        skip_first = not isinstance(_find_in_mro(theclass, themethod), staticmethod)
         themethod = getattr(theclass, themethod)
 
+        skip = _skip_set(skip)
+
         return self._add_signature_arguments([themethod],
                                              nested_key,
                                              as_group,
@@ -135,6 +352,8 @@ class SignatureArguments:
         if not callable(function):
             raise ValueError('Expected "function" argument to be a callable object.')
 
+        skip = _skip_set(skip)
+
         return self._add_signature_arguments([function],
                                              nested_key,
                                              as_group,
@@ -148,8 +367,8 @@ class SignatureArguments:
         nested_key: Optional[str],
         as_group: bool,
         as_positional: bool,
-        skip: Optional[Container[str]],
-        docs_func: Callable = lambda x: [x.__doc__],
+        skip: Container[str],
+        docs_func: Callable = _object_docs,
         sign_func: Callable = lambda x: x,
         skip_first: bool = False,
     ) -> int:
@@ -171,23 +390,27 @@ class SignatureArguments:
         Raises:
             ValueError: When there are required parameters without at least one valid type.
         """
-        kinds = inspect._ParameterKind
-
         def update_has_args_kwargs(base, has_args=True, has_kwargs=True):
-            params = list(inspect.signature(sign_func(base)).parameters.values())
-            has_args &= any(p._kind == kinds.VAR_POSITIONAL for p in params)
-            has_kwargs &= any(p._kind == kinds.VAR_KEYWORD for p in params)
-            return has_args, has_kwargs
+            params = _cached_signature(sign_func(base)).parameters.values()
+            names = tuple(p.name for p in params)
+            kinds = tuple(p._kind for p in params)
+            annotations = tuple(p.annotation for p in params)
+            defaults = tuple(p.default for p in params)
+            has_args &= _VAR_POS in kinds
+            has_kwargs &= _VAR_KW in kinds
+            return (names, kinds, annotations, defaults), has_args, has_kwargs
 
         ## Determine propagation of arguments ##
         add_types = [(True, True)]
-        has_args, has_kwargs = update_has_args_kwargs(objects[0])
+        params, has_args, has_kwargs = update_has_args_kwargs(objects[0])
+        objects_params = [params]
         for num in range(1, len(objects)):
             if not (has_args or has_kwargs):
                 objects = objects[:num]
                 break
             add_types.append((has_args, has_kwargs))
-            has_args, has_kwargs = update_has_args_kwargs(objects[num], has_args, has_kwargs)
+            params, has_args, has_kwargs = update_has_args_kwargs(objects[num], has_args, has_kwargs)
+            objects_params.append(params)
 
         ## Gather docstrings ##
         doc_group, doc_params = self._gather_docstrings(objects, docs_func)
@@ -196,35 +419,36 @@ class SignatureArguments:
         group = self._create_group_if_requested(objects[0], nested_key, as_group, doc_group)
 
         ## Add objects arguments ##
-        added_args = set()
-        if skip is None:
-            skip = set()
-        if dataclasses_support:
-            dataclasses = import_dataclasses('_add_signature_arguments')
-        for obj, (add_args, add_kwargs) in zip(objects, add_types):
-            for num, param in enumerate(inspect.signature(sign_func(obj)).parameters.values()):
-                name = param.name
-                kind = param._kind  # type: ignore
-                annotation = param.annotation
-                default = param.default
-                is_required = default == inspect._empty  # type: ignore
-                skip_message = 'Skipping parameter "'+name+'" from "'+obj.__name__+'" because of: '
-                if kind in {kinds.VAR_POSITIONAL, kinds.VAR_KEYWORD} or \
+        added_args = {}  # type: Dict[str, None]
+        prefix = nested_key+'.' if nested_key else ''
+        logger = self.logger  # type: ignore
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        def log_skip(name, obj, reason):
+            if debug:
+                logger.debug('Skipping parameter "%s" from "%s" because of: %s', name, obj.__name__, reason)
+
+        for obj, (names, kinds, annotations, defaults), (add_args, add_kwargs) in zip(objects, objects_params, add_types):
+            propagated = add_args and add_kwargs
+            for num, (name, kind, annotation, default) in enumerate(zip(names, kinds, annotations, defaults)):
+                is_required = default is _EMPTY
+                if kind is _VAR_POS or kind is _VAR_KW or \
                    (is_required and skip_first and num == 0) or \
-                   (annotation == inspect._empty and not is_required and default is None):  # type: ignore
-                    continue
-                elif is_required and not add_args:
-                    self.logger.debug(skip_message+'Positional parameter but *args not propagated.')  # type: ignore
+                   (annotation is _EMPTY and not is_required and default is None):
                     continue
-                elif not is_required and not add_kwargs:
-                    self.logger.debug(skip_message+'Keyword parameter but **kwargs not propagated.')  # type: ignore
+                if not propagated:
+                    if is_required and not add_args:
+                        log_skip(name, obj, 'Positional parameter but *args not propagated.')
+                        continue
+                    if not is_required and not add_kwargs:
+                        log_skip(name, obj, 'Keyword parameter but **kwargs not propagated.')
+                        continue
+                if skip and name in skip:
+                    log_skip(name, obj, 'Parameter requested to be skipped.')
                     continue
-                elif name in skip:
-                    self.logger.debug(skip_message+'Parameter requested to be skipped.')  # type: ignore
-                    continue
-                if dataclasses_support and default.__class__ == dataclasses._HAS_DEFAULT_FACTORY_CLASS:
+                if default.__class__ is _HAS_DEFAULT_FACTORY_CLASS:
                     default = obj.__dataclass_fields__[name].default_factory()
-                if annotation == inspect._empty and not is_required:  # type: ignore
+                if annotation is _EMPTY and not is_required:
                     annotation = type(default)
                 kwargs = {'help': doc_params.get(name)}
                 if not is_required:
@@ -233,24 +457,23 @@ class SignatureArguments:
                         annotation = Optional[annotation]
                 elif not as_positional:
                     kwargs['required'] = True
-                if annotation in {str, int, float, bool} or \
-                   _issubclass(annotation, (str, int, float)):
+                if _is_primitive(annotation):
                     kwargs['type'] = annotation
-                elif _issubclass(annotation, Enum):
+                elif _is_enum(annotation):
                     kwargs['action'] = ActionEnum(enum=annotation)
                 else:
                     try:
-                        kwargs['action'] = ActionJsonSchema(annotation=annotation, enable_path=False)
+                        kwargs['action'] = _jsonschema_action(annotation)
                     except ValueError as ex:
-                        self.logger.debug(skip_message+str(ex))  # type: ignore
+                        log_skip(name, obj, str(ex))
                 if 'type' in kwargs or 'action' in kwargs:
-                    dest = (nested_key+'.' if nested_key else '') + name
+                    dest = prefix + name
                     if dest in added_args:
-                        self.logger.debug(skip_message+'Argument already added.')  # type: ignore
+                        log_skip(name, obj, 'Argument already added.')
                     else:
                         opt_str = dest if is_required and as_positional else '--'+dest
                         group.add_argument(opt_str, **kwargs)
-                        added_args.add(dest)
+                        added_args[dest] = None
                 elif is_required:
                     raise ValueError('Required parameter without a type for '+obj.__name__+' parameter '+name+'.')
 
@@ -288,10 +511,7 @@ class SignatureArguments:
         if not inspect.isclass(baseclass):
             raise ValueError('Expected "baseclass" argument to be a class object.')
 
-        def docs_func(base):
-            return [base.__init__.__doc__, base.__doc__]
-
-        doc_group = self._gather_docstrings([baseclass], docs_func)[0]
+        doc_group = self._gather_docstrings([baseclass], _class_docs)[0]
         group = self._create_group_if_requested(baseclass, nested_key, as_group, doc_group, config_load=False)
 
         group.add_argument('--'+nested_key+'.help', action=_ActionHelpClassPath(baseclass=baseclass))
@@ -309,19 +529,18 @@ class SignatureArguments:
         doc_group = None
         doc_params = {}
         if docstring_parser_support:
-            docstring_parse = import_docstring_parse('_gather_docstrings')
             for base in objects:
                 for doc in docs_func(base):
                     try:
-                        docstring = docstring_parse(doc)
+                        docstring = _parse_doc(doc)
                     except ValueError:
                         self.logger.debug('Failed parsing docstring for '+str(base))
-                    else:
-                        if docstring.short_description and not doc_group:
-                            doc_group = docstring.short_description
-                        for param in docstring.params:
-                            if param.arg_name not in doc_params:
-                                doc_params[param.arg_name] = param.description
+                        continue
+                    if docstring.short_description and not doc_group:
+                        doc_group = docstring.short_description
+                    for param in docstring.params:
+                        if param.arg_name not in doc_params:
+                            doc_params[param.arg_name] = param.description
         return doc_group, doc_params
 
 
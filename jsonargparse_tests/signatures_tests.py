@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
+import gc
+import sys
+import inspect
 import json
+import weakref
 import yaml
 import calendar
 from enum import Enum
@@ -9,6 +13,7 @@ from contextlib import redirect_stdout
 from typing import Dict, List, Tuple, Optional, Union, Any
 from jsonargparse_tests.base import *
 from jsonargparse.actions import _find_action
+from jsonargparse.signatures import _signature, _jsonschema_action, _parse_doc
 from jsonargparse.util import _suppress_stderr
 
 
@@ -155,6 +160,27 @@ class SignaturesTests(unittest.TestCase):
         self.assertEqual({2: 7, 4: 9}, parser.parse_args(['--a1={"2": 7, "4": 9}']).a1)
 
 
+    def test_add_class_arguments_mro_object(self):
+
+        class Mixin:
+            pass
+
+        class Base:
+            def __init__(self, a1: int = 1):
+                pass
+
+        class Class1(Mixin, Base):
+            def __init__(self, a2: float = 2.0, **kwargs):
+                super().__init__(**kwargs)
+
+        parser = ArgumentParser(error_handler=None)
+        self.assertEqual(2, parser.add_class_arguments(Class1))
+        self.assertEqual(Namespace(a1=1, a2=2.0), parser.get_defaults())
+
+        parser = ArgumentParser(error_handler=None)
+        self.assertEqual(0, parser.add_class_arguments(Mixin))
+
+
     def test_add_method_arguments(self):
 
         class MyClass:
@@ -308,13 +334,24 @@ class SignaturesTests(unittest.TestCase):
                  a4: int = 4):
             return a1
 
-        parser = ArgumentParser()
-        parser.add_function_arguments(func, skip={'a2', 'a4'})
+        class Cont:
+            def __contains__(self, name):
+                return name in {'a2', 'a4'}
+
+        for skip in [{'a2', 'a4'}, ['a2', 'a4'], ('a4', 'a2'), Cont()]:
+            parser = ArgumentParser()
+            parser.add_function_arguments(func, skip=skip)
 
-        for key in ['a1', 'a3']:
+            for key in ['a1', 'a3']:
+                self.assertIsNotNone(_find_action(parser, key), key+' should be in parser but is not')
+            for key in ['a2', 'a4']:
+                self.assertIsNone(_find_action(parser, key), key+' should not be in parser but is')
+
+        parser = ArgumentParser()
+        parser.add_function_arguments(func, skip='a2')
+        for key in ['a1', 'a3', 'a4']:
             self.assertIsNotNone(_find_action(parser, key), key+' should be in parser but is not')
-        for key in ['a2', 'a4']:
-            self.assertIsNone(_find_action(parser, key), key+' should not be in parser but is')
+        self.assertIsNone(_find_action(parser, 'a2'), 'a2 should not be in parser but is')
 
 
     def test_basic_subtypes(self):
@@ -434,7 +471,8 @@ class SignaturesTests(unittest.TestCase):
                 """
                 pass
 
-        with mock.patch('docstring_parser.parse') as docstring_parse:
+        _parse_doc.cache_clear()
+        with mock.patch('jsonargparse.signatures.docstring_parse') as docstring_parse:
             docstring_parse.side_effect = ValueError
             parser = ArgumentParser(error_handler=None)
             parser.add_class_arguments(Class1)
@@ -444,6 +482,137 @@ class SignaturesTests(unittest.TestCase):
             parser.print_help(help_str)
             self.assertIn('--a1 A1', help_str.getvalue())
             self.assertNotIn('a1 description', help_str.getvalue())
+        _parse_doc.cache_clear()
+
+
+    def test_cached_signature(self):
+
+        def func(a1: int = 1):
+            return a1
+
+        with mock.patch('jsonargparse.signatures._signature', wraps=_signature) as signature:
+            for _ in range(2):
+                parser = ArgumentParser(error_handler=None)
+                parser.add_function_arguments(func)
+                self.assertEqual(2, parser.parse_args(['--a1=2']).a1)
+            self.assertEqual(1, signature.call_count)
+
+            func.__defaults__ = (5,)
+            parser = ArgumentParser(error_handler=None)
+            parser.add_function_arguments(func)
+            self.assertEqual(5, parser.get_defaults().a1)
+            self.assertEqual(2, signature.call_count)
+
+        def func(*, a1: int = 1):
+            return a1
+
+        for _ in range(2):
+            parser = ArgumentParser(error_handler=None)
+            parser.add_function_arguments(func)
+        func.__kwdefaults__['a1'] = 7
+        func.__annotations__['a1'] = str
+        parser = ArgumentParser(error_handler=None)
+        parser.add_function_arguments(func)
+        self.assertEqual('7', parser.parse_args(['--a1=7']).a1)
+        self.assertEqual(7, parser.get_defaults().a1)
+
+        func.__signature__ = inspect.Signature([inspect.Parameter('a2', inspect.Parameter.KEYWORD_ONLY, default=2, annotation=int)])
+        parser = ArgumentParser(error_handler=None)
+        parser.add_function_arguments(func)
+        self.assertEqual(Namespace(a2=2), parser.get_defaults())
+
+
+    def test_cached_signature_garbage_collected(self):
+
+        def make_classes():
+            class Color(Enum):
+                red = 1
+            class Item:
+                pass
+            class DynamicClass:
+                def __init__(self, a1: int = 1, a2: Color = Color.red, a3: Optional[Item] = None):
+                    pass
+            return DynamicClass, Color, Item
+
+        classes = make_classes()
+        parser = ArgumentParser(error_handler=None)
+        parser.add_class_arguments(classes[0])
+        self.assertEqual(1, parser.get_defaults().a1)
+
+        class_refs = [weakref.ref(c) for c in classes]
+        del classes, parser
+        for cleanup in getattr(sys.modules['typing'], '_cleanups', []):  # typing caches Optional[Item]
+            cleanup()
+        gc.collect()
+        gc.collect()  # annotations are freed once the cached signature of DynamicClass is dropped
+        self.assertEqual([None, None, None], [r() for r in class_refs])
+
+
+    def test_signature_from_code(self):
+
+        def func1(a1, a2: int = 2, *args: str, a3, a4: float = 4.0, **kwargs: bool) -> str:
+            return a1
+
+        def func2(a1=1, a2: Optional[str] = None):
+            return a1
+
+        def func3(*, a1):
+            return a1
+
+        for func in [func1, func2, func3, lambda: None]:
+            self.assertEqual(inspect.signature(func), _signature(func))
+
+        func3.__signature__ = 'a1'
+        self.assertRaises(TypeError, lambda: inspect.signature(func3))
+        self.assertRaises(TypeError, lambda: _signature(func3))
+
+
+    def test_cached_jsonschema_action(self):
+
+        def func(a1: List[int] = [1], a2: List[int] = [2]):
+            return a1
+
+        parser = ArgumentParser(error_handler=None)
+        parser.add_function_arguments(func)
+        self.assertIs(_jsonschema_action(List[int]), _jsonschema_action(List[int]))
+        self.assertIsNot(_find_action(parser, 'a1'), _find_action(parser, 'a2'))
+        cfg = parser.parse_args(['--a2=[3, 4]'])
+        self.assertEqual(([1], [3, 4]), (cfg.a1, cfg.a2))
+
+        def func(a1: Union[int, str] = 1, a2: Union[str, int] = 2):
+            return a1
+
+        parser = ArgumentParser(error_handler=None)
+        parser.add_function_arguments(func)
+        self.assertEqual(Union[int, str], Union[str, int])
+        self.assertEqual(repr(Union[int, str]), repr(_find_action(parser, 'a1')._annotation))
+        self.assertEqual(repr(Union[str, int]), repr(_find_action(parser, 'a2')._annotation))
+
+
+    @unittest.skipIf(not docstring_parser_support, 'docstring-parser package is required')
+    def test_cached_docstrings(self):
+
+        class Class1:
+            def __init__(self, b1: int = 1):
+                """Class1 cached description
+
+                Args:
+                    b1: b1 cached description
+                """
+
+        import docstring_parser
+        _parse_doc.cache_clear()
+        with mock.patch('jsonargparse.signatures.docstring_parse', wraps=docstring_parser.parse) as docstring_parse:
+            call_counts = []
+            for _ in range(2):
+                parser = ArgumentParser(error_handler=None)
+                parser.add_class_arguments(Class1)
+                self.assertEqual('Class1 cached description', parser.groups['Class1'].title)
+                self.assertEqual('b1 cached description', _find_action(parser, 'b1').help)
+                call_counts.append(docstring_parse.call_count)
+            self.assertEqual(call_counts[0], call_counts[1])
+            self.assertGreater(call_counts[0], 0)
+        _parse_doc.cache_clear()
 
 
 @unittest.skipIf(not jsonschema_support, 'jsonschema package is required')